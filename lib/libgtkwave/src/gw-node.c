@@ -240,3 +240,47 @@ GwExpandInfo *gw_node_expand(GwNode *self)
 
     return rc;
 }
+
+GwHistEnt *gw_node_find_hist_at_time(GwNode *self, GwTime time)
+{
+    g_return_val_if_fail(self != NULL, NULL);
+
+    GwHistEnt *current = &self->head;
+    GwHistEnt *result = NULL;
+
+    while (current != NULL && current->time <= time) {
+        result = current;
+        current = current->next;
+    }
+
+    return result;
+}
+
+/* Returns the full list length even when it exceeds capacity, so callers can
+   size their arrays with a counting call (capacity 0, NULL outputs) instead of
+   trusting numhist, which the VCD loader leaves holding an unrelated value. */
+gint gw_node_flatten(GwNode *self, gint capacity, GwTime *times, guint8 *vals, GwHistEnt **entries)
+{
+    g_return_val_if_fail(self != NULL, 0);
+
+    GwHistEnt *current = &self->head;
+    gint count = 0;
+
+    while (current != NULL) {
+        if (count < capacity) {
+            if (times != NULL) {
+                times[count] = current->time;
+            }
+            if (vals != NULL) {
+                vals[count] = current->v.h_val;
+            }
+            if (entries != NULL) {
+                entries[count] = current;
+            }
+        }
+        count++;
+        current = current->next;
+    }
+
+    return count;
+}
@@ -70,3 +70,5 @@ struct _GwNode
 #endif
 
 GwExpandInfo *gw_node_expand(GwNode *self);
+GwHistEnt *gw_node_find_hist_at_time(GwNode *self, GwTime time);
+gint gw_node_flatten(GwNode *self, gint capacity, GwTime *times, guint8 *vals, GwHistEnt **entries);
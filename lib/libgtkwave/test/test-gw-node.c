@@ -34,11 +34,99 @@ static void test_expand(void)
     g_object_unref(file);
 }
 
+static void test_find_hist_at_time(void)
+{
+    GwLoader *loader = gw_fst_loader_new();
+    GwDumpFile *file = gw_loader_load(loader, "files/basic.fst", NULL);
+    g_assert_nonnull(file);
+    g_object_unref(loader);
+
+    g_assert_true(gw_dump_file_import_all(file, NULL));
+
+    GwSymbol *bit = gw_dump_file_lookup_symbol(file, "variables.bit");
+    g_assert_nonnull(bit);
+    GwNode *node = bit->n;
+
+    // before the first entry
+    g_assert_null(gw_node_find_hist_at_time(node, -3));
+
+    // exact hit on a transition
+    GwHistEnt *hist = gw_node_find_hist_at_time(node, 3);
+    g_assert_nonnull(hist);
+    g_assert_cmpint(hist->time, ==, 3);
+    g_assert_cmpint(hist->v.h_val, ==, GW_BIT_1);
+
+    // between transitions the previous entry wins
+    hist = gw_node_find_hist_at_time(node, 100);
+    g_assert_nonnull(hist);
+    g_assert_cmpint(hist->time, ==, 8);
+    g_assert_cmpint(hist->v.h_val, ==, GW_BIT_DASH);
+
+    // past the end
+    hist = gw_node_find_hist_at_time(node, G_MAXINT64);
+    g_assert_nonnull(hist);
+    g_assert_cmpint(hist->time, ==, G_MAXINT64);
+    g_assert_null(hist->next);
+
+    g_object_unref(file);
+}
+
+static void test_flatten(void)
+{
+    GwLoader *loader = gw_fst_loader_new();
+    GwDumpFile *file = gw_loader_load(loader, "files/basic.fst", NULL);
+    g_assert_nonnull(file);
+    g_object_unref(loader);
+
+    g_assert_true(gw_dump_file_import_all(file, NULL));
+
+    GwSymbol *bit = gw_dump_file_lookup_symbol(file, "variables.bit");
+    g_assert_nonnull(bit);
+    GwNode *node = bit->n;
+
+    // the counting call must report the actual list length, which may
+    // differ from numhist (the VCD loader overloads that field)
+    gint expected = 0;
+    for (GwHistEnt *h = &node->head; h != NULL; h = h->next) {
+        expected++;
+    }
+
+    gint count = gw_node_flatten(node, 0, NULL, NULL, NULL);
+    g_assert_cmpint(count, ==, expected);
+
+    GwTime *times = g_new0(GwTime, count);
+    guint8 *vals = g_new0(guint8, count);
+    GwHistEnt **entries = g_new0(GwHistEnt *, count);
+    g_assert_cmpint(gw_node_flatten(node, count, times, vals, entries), ==, count);
+
+    gint i = 0;
+    for (GwHistEnt *h = &node->head; h != NULL; h = h->next) {
+        g_assert_true(entries[i] == h);
+        g_assert_cmpint(times[i], ==, h->time);
+        g_assert_cmpint(vals[i], ==, h->v.h_val);
+        i++;
+    }
+
+    // a short buffer is filled to capacity but the full length is returned
+    times[1] = 0;
+    g_assert_cmpint(gw_node_flatten(node, 1, times, vals, entries), ==, count);
+    g_assert_cmpint(times[0], ==, node->head.time);
+    g_assert_cmpint(times[1], ==, 0);
+
+    g_free(times);
+    g_free(vals);
+    g_free(entries);
+
+    g_object_unref(file);
+}
+
 int main(int argc, char *argv[])
 {
     g_test_init(&argc, &argv, NULL);
 
     g_test_add_func("/node/expand", test_expand);
+    g_test_add_func("/node/find_hist_at_time", test_find_hist_at_time);
+    g_test_add_func("/node/flatten", test_flatten);
 
     return g_test_run();
 }
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+    Optional cffi fast path for read_signal_ctypes.py.
+
+    ctypes issues a libffi trampoline for every foreign call and builds a
+    fresh Python object for every POINTER(...).contents dereference.  cffi
+    (in ABI mode, no compiler needed) keeps struct-field access inside
+    CPython's C layer, so walking the GwHistEnt linked list is much cheaper
+    per node.
+
+    This module is entirely optional: read_signal_ctypes.py falls back to
+    plain ctypes when cffi is not installed.
+"""
+
+try:
+    from cffi import FFI
+except ImportError:
+    FFI = None
+
+# Only the declarations needed on the hot path.  These mirror
+# lib/libgtkwave/src/gw-hist-ent.h.
+_CDEF = """
+typedef int64_t GwTime;
+
+typedef struct _GwHistEnt GwHistEnt;
+
+struct _GwHistEnt
+{
+    GwHistEnt *next;
+
+    union
+    {
+        unsigned char h_val;
+        char *h_vector;
+        double h_double;
+    } v;
+
+    GwTime time;
+    uint8_t flags;
+};
+"""
+
+
+class GwCffi:
+    """Thin cffi wrapper around the hot libgtkwave accessors."""
+
+    def __init__(self, lib_path):
+        self.ffi = FFI()
+        self.ffi.cdef(_CDEF)
+        self.lib = self.ffi.dlopen(lib_path)
+
+    def find_value_at_time(self, head_addr, time):
+        """Walk the history list starting at head_addr (an integer address).
+
+        Returns the address of the last entry with entry->time <= time,
+        or 0 if there is none.  Struct-field access happens inside cffi's
+        C layer instead of going through ctypes descriptors.
+        """
+        ffi = self.ffi
+        current = ffi.cast("GwHistEnt *", head_addr)
+        result = ffi.NULL
+
+        while current != ffi.NULL and current.time <= time:
+            result = current
+            current = current.next
+
+        return int(ffi.cast("uintptr_t", result))
+
+
+def open_library(lib_path):
+    """Return a GwCffi wrapper for lib_path, or None if cffi is missing."""
+    if FFI is None:
+        return None
+    return GwCffi(lib_path)
@@ -0,0 +1,114 @@
+"""
+    Optional Numba fast path for read_signal_ctypes.py.
+
+    The GwHistEnt linked-list walk is memory-bound pointer chasing; once
+    attribute-lookup overhead is gone the remaining cost is the
+    interpreter loop itself.  With Numba installed the walk compiles to
+    machine code operating directly on the entry addresses, so no Python
+    objects are created per node at all.
+
+    Like _gtkwave_cffi.py this module is entirely optional: walk_to_time
+    and flatten are None when Numba is not installed and
+    read_signal_ctypes.py falls back to its other strategies.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, carray, types
+    from numba.core import cgutils
+    from numba.extending import intrinsic
+except ImportError:
+    njit = None
+
+walk_to_time = None
+flatten = None
+
+if njit is not None:
+    # GwHistEnt layout (little-endian 64-bit): next, v-union, time, flags
+    _HIST_DTYPE = np.dtype({
+        "names": ["next", "v", "time", "flags"],
+        "formats": [np.uint64, np.uint64, np.int64, np.uint8],
+        "offsets": [0, 8, 16, 24],
+        "itemsize": 32,
+    })
+
+    @intrinsic
+    def _as_void_pointer(typingctx, src):
+        """Reinterpret an integer as a raw pointer inside compiled code."""
+        sig = types.voidptr(src)
+
+        def codegen(cgctx, builder, signature, args):
+            return builder.inttoptr(args[0], cgutils.voidptr_t)
+
+        return sig, codegen
+
+    # Explicit signatures keep every address uint64: mixing an int64
+    # argument with the uint64 "next" field would make Numba unify the
+    # types to float64 and break the inttoptr cast.
+    @njit("uint64(uint64, int64)", cache=True)
+    def walk_to_time(head_addr, time):
+        """Return the address of the last entry with entry->time <= time.
+
+        head_addr is the address of node->head; returns 0 when the first
+        entry is already past the requested time.
+        """
+        result = np.uint64(0)
+        addr = head_addr
+
+        while addr != 0:
+            ent = carray(_as_void_pointer(addr), 1, dtype=_HIST_DTYPE)
+            if ent[0]["time"] > time:
+                break
+            result = addr
+            addr = ent[0]["next"]
+
+        return result
+
+    @njit("int64(uint64, int64[:], uint8[:], uint64[:])", cache=True)
+    def flatten(head_addr, times, vals, addrs):
+        """Dump the history list into SoA arrays; returns the count.
+
+        The caller sizes the arrays; the walk stops at the list end or
+        when the arrays are full.
+        """
+        capacity = times.shape[0]
+        count = 0
+        addr = head_addr
+
+        while addr != 0 and count < capacity:
+            ent = carray(_as_void_pointer(addr), 1, dtype=_HIST_DTYPE)
+            times[count] = ent[0]["time"]
+            vals[count] = ent[0]["v"] & 0xFF
+            addrs[count] = addr
+            count += 1
+            addr = ent[0]["next"]
+
+        return count
+
+
+if __name__ == "__main__":
+    # Smoke test: run both walkers over a synthetic three-entry chain
+    if njit is None:
+        raise SystemExit("numba is not installed")
+
+    chain = np.zeros(3, dtype=_HIST_DTYPE)
+    base = chain.ctypes.data
+    for i, t in enumerate((-1, 5, 10)):
+        chain[i]["time"] = t
+        chain[i]["v"] = i + 1
+        chain[i]["next"] = base + (i + 1) * _HIST_DTYPE.itemsize if i < 2 else 0
+
+    assert walk_to_time(base, -2) == 0
+    assert walk_to_time(base, -1) == base
+    assert walk_to_time(base, 7) == base + _HIST_DTYPE.itemsize
+    assert walk_to_time(base, 99) == base + 2 * _HIST_DTYPE.itemsize
+
+    times = np.empty(3, np.int64)
+    vals = np.empty(3, np.uint8)
+    addrs = np.empty(3, np.uint64)
+    assert flatten(base, times, vals, addrs) == 3
+    assert list(times) == [-1, 5, 10]
+    assert list(vals) == [1, 2, 3]
+    assert int(addrs[2]) == base + 2 * _HIST_DTYPE.itemsize
+
+    print("ok")
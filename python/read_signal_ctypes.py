@@ -0,0 +1,724 @@
+"""
+    Python port of read_signal.c using ctypes.
+
+    It demonstrates:
+    - Loading waveform files using GTKWave's libgtkwave
+      * Supports VCD, FST, and GHW formats (auto-detected)
+    - Looking up signals by hierarchical name
+    - Reading signal values at specific times
+    - Working with both scalar (1-bit) and vector (multi-bit) signals
+
+    Usage:
+      python3 read_signal_ctypes.py [filename]
+
+    Examples:
+      python3 read_signal_ctypes.py                 # Uses default VCD file
+      python3 read_signal_ctypes.py waves.fst       # Read FST file
+      python3 read_signal_ctypes.py dump.vcd.gz     # Read compressed VCD
+
+    When cffi is installed, uncached history traversal goes through
+    _gtkwave_cffi.py instead of ctypes, which avoids one libffi trampoline
+    per call.  Without cffi the script runs on plain ctypes.
+"""
+
+import bisect
+import ctypes
+import os
+import struct
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from ctypes import POINTER, byref, c_char, c_char_p, c_double, c_int, c_longlong, c_uint, \
+    c_uint8, c_void_p
+
+import _gtkwave_cffi
+import _gtkwave_numba
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# GwTime is a gint64 (see lib/libgtkwave/src/gw-time.h)
+GwTime = c_longlong
+
+# GwBit values (see lib/libgtkwave/src/gw-bit.h)
+GW_BIT_0 = 0
+GW_BIT_X = 1
+GW_BIT_Z = 2
+GW_BIT_1 = 3
+
+
+# Struct layouts mirroring lib/libgtkwave/src.  Only the fields this example
+# reads are declared past the ones needed to get the offsets right; the
+# structs are never allocated from Python, only cast from library pointers.
+
+class GwHistEntValue(ctypes.Union):
+    _fields_ = [
+        ("h_val", c_uint8),
+        ("h_vector", c_void_p),  # array of GwBit bytes; c_void_p so NUL bytes survive
+        ("h_double", c_double),
+    ]
+
+
+class GwHistEnt(ctypes.Structure):
+    pass
+
+
+GwHistEnt._fields_ = [
+    ("next", POINTER(GwHistEnt)),
+    ("v", GwHistEntValue),
+    ("time", GwTime),
+    ("flags", c_uint8),
+]
+
+
+class GwNode(ctypes.Structure):
+    _fields_ = [
+        ("expansion", c_void_p),
+        ("nname", c_char_p),
+        ("head", GwHistEnt),
+        ("curr", POINTER(GwHistEnt)),
+        ("harray", POINTER(POINTER(GwHistEnt))),
+        ("mv", c_void_p),
+        ("msi", c_int),
+        ("lsi", c_int),
+        ("numhist", c_int),
+        # varxt/vardt/vardir/vartype/extvals bitfields follow; unused here
+    ]
+
+
+class GwSymbol(ctypes.Structure):
+    pass
+
+
+GwSymbol._fields_ = [
+    ("sym_next", POINTER(GwSymbol)),
+    ("vec_root", POINTER(GwSymbol)),
+    ("vec_chain", POINTER(GwSymbol)),
+    ("name", c_char_p),
+    ("n", POINTER(GwNode)),
+    ("s_selected", c_char),
+]
+
+
+class GError(ctypes.Structure):
+    _fields_ = [
+        ("domain", c_uint),
+        ("code", c_int),
+        ("message", c_char_p),
+    ]
+
+
+def _find_library():
+    """Locate the built libgtkwave shared library (see run.sh)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    lib_dir = os.environ.get(
+        "GTKWAVE_LIBDIR",
+        os.path.join(script_dir, "..", "build", "lib", "libgtkwave", "src"))
+
+    for name in ("libgtkwave.so", "libgtkwave.dylib"):
+        path = os.path.join(lib_dir, name)
+        if os.path.exists(path):
+            return path
+
+    sys.stderr.write("Error: libgtkwave not found in %s\n" % lib_dir)
+    sys.stderr.write("Build GTKWave first (meson setup build && ninja -C build)\n")
+    sys.stderr.write("or point GTKWAVE_LIBDIR at the library directory.\n")
+    sys.exit(1)
+
+
+_lib_path = _find_library()
+
+# RTLD_NOW resolves every symbol up front instead of faulting in PLT
+# fixups on first call; RTLD_LOCAL keeps the namespace clean
+libgtkwave = ctypes.CDLL(_lib_path, mode=os.RTLD_NOW | os.RTLD_LOCAL)
+
+# cffi fast path for the hot accessors; None when cffi is not installed
+_cffi = _gtkwave_cffi.open_library(_lib_path)
+
+# Function prototypes, registered once at import time
+libgtkwave.gw_vcd_loader_new.restype = c_void_p
+libgtkwave.gw_fst_loader_new.restype = c_void_p
+libgtkwave.gw_ghw_loader_new.restype = c_void_p
+
+libgtkwave.gw_loader_load.argtypes = [c_void_p, c_char_p, POINTER(POINTER(GError))]
+libgtkwave.gw_loader_load.restype = c_void_p
+
+libgtkwave.gw_dump_file_import_all.argtypes = [c_void_p, POINTER(POINTER(GError))]
+libgtkwave.gw_dump_file_import_all.restype = c_int
+
+libgtkwave.gw_dump_file_get_time_range.argtypes = [c_void_p]
+libgtkwave.gw_dump_file_get_time_range.restype = c_void_p
+
+libgtkwave.gw_time_range_get_start.argtypes = [c_void_p]
+libgtkwave.gw_time_range_get_start.restype = GwTime
+
+libgtkwave.gw_time_range_get_end.argtypes = [c_void_p]
+libgtkwave.gw_time_range_get_end.restype = GwTime
+
+libgtkwave.gw_dump_file_get_time_scale.argtypes = [c_void_p]
+libgtkwave.gw_dump_file_get_time_scale.restype = GwTime
+
+libgtkwave.gw_dump_file_get_facs.argtypes = [c_void_p]
+libgtkwave.gw_dump_file_get_facs.restype = c_void_p
+
+libgtkwave.gw_facs_get_length.argtypes = [c_void_p]
+libgtkwave.gw_facs_get_length.restype = c_uint
+
+libgtkwave.gw_facs_get_array.argtypes = [c_void_p]
+libgtkwave.gw_facs_get_array.restype = POINTER(POINTER(GwSymbol))
+
+libgtkwave.gw_dump_file_lookup_symbol.argtypes = [c_void_p, c_char_p]
+libgtkwave.gw_dump_file_lookup_symbol.restype = POINTER(GwSymbol)
+
+# gw_node_find_hist_at_time is a recent addition; tolerate older builds
+try:
+    libgtkwave.gw_node_find_hist_at_time.argtypes = [POINTER(GwNode), GwTime]
+    libgtkwave.gw_node_find_hist_at_time.restype = POINTER(GwHistEnt)
+    _gw_node_find_hist_at_time = libgtkwave.gw_node_find_hist_at_time
+except AttributeError:
+    _gw_node_find_hist_at_time = None
+
+# gw_node_flatten likewise; it dumps a node's history into SoA arrays
+try:
+    libgtkwave.gw_node_flatten.argtypes = [POINTER(GwNode), c_int, POINTER(GwTime),
+                                           POINTER(c_uint8),
+                                           POINTER(POINTER(GwHistEnt))]
+    libgtkwave.gw_node_flatten.restype = c_int
+    _gw_node_flatten = libgtkwave.gw_node_flatten
+except AttributeError:
+    _gw_node_flatten = None
+
+# Per-node sorted history index, keyed by the node's address
+_HISTORY_INDEX = {}
+
+# (symbol array, length) per dump file
+_FACS_CACHE = {}
+
+# Move-to-front symbol cache: bursty query patterns hit a small working
+# set of signals, so recently used entries live at the front and the
+# least recently used one falls off the back when the cache is full
+_SYMBOL_CACHE = OrderedDict()
+_SYMBOL_CACHE_MAX = 4096
+
+# Native layout of GwHistEnt (next, v-union as uint64, time, flags).
+# struct decodes all fields in one C call where ctypes pays a descriptor
+# traversal per field.  Assumes a little-endian host, like the rest of
+# the raw-buffer handling here.
+_HIST_STRUCT = struct.Struct("PQqB")
+
+# Mirrors BIT_TO_CHAR in gw-bit.c, indexed directly by GwBit value; a
+# table lookup here replaces an FFI call per formatted sample
+_BIT_TO_CHAR = "0xz1huwl-???????"
+
+# 256-entry translate table mapping raw GwBit bytes to their display
+# characters, so a whole h_vector becomes ASCII in one bytes.translate
+_GWBIT_TO_ASCII = bytes(ord(_BIT_TO_CHAR[b & 0xF]) for b in range(256))
+
+# g_object_unref/g_error_free resolve through libgtkwave's glib dependency
+libgtkwave.g_object_unref.argtypes = [c_void_p]
+libgtkwave.g_error_free.argtypes = [c_void_p]
+
+# Hoist every bound function to a module-level name.  getattr on a CDLL
+# is a dict lookup per call site; a direct global (or a local rebound at
+# function top) skips it on the hot paths.
+_gw_vcd_loader_new = libgtkwave.gw_vcd_loader_new
+_gw_fst_loader_new = libgtkwave.gw_fst_loader_new
+_gw_ghw_loader_new = libgtkwave.gw_ghw_loader_new
+_gw_loader_load = libgtkwave.gw_loader_load
+_gw_dump_file_import_all = libgtkwave.gw_dump_file_import_all
+_gw_dump_file_get_time_range = libgtkwave.gw_dump_file_get_time_range
+_gw_time_range_get_start = libgtkwave.gw_time_range_get_start
+_gw_time_range_get_end = libgtkwave.gw_time_range_get_end
+_gw_dump_file_get_time_scale = libgtkwave.gw_dump_file_get_time_scale
+_gw_dump_file_get_facs = libgtkwave.gw_dump_file_get_facs
+_gw_facs_get_length = libgtkwave.gw_facs_get_length
+_gw_facs_get_array = libgtkwave.gw_facs_get_array
+_gw_dump_file_lookup_symbol = libgtkwave.gw_dump_file_lookup_symbol
+_g_object_unref = libgtkwave.g_object_unref
+_g_error_free = libgtkwave.g_error_free
+
+
+def _report_error(prefix, error):
+    message = error.contents.message.decode() if error else "unknown error"
+    sys.stderr.write("Error: %s: %s\n" % (prefix, message))
+    if error:
+        _g_error_free(error)
+
+
+def _hist_fields(hist):
+    """Return (next, v, time, flags) of a history entry in one unpack.
+
+    v is the raw 8-byte union; h_val is its low byte and h_vector the
+    whole quadword reinterpreted as a pointer.
+    """
+    buf = (c_uint8 * _HIST_STRUCT.size).from_address(ctypes.addressof(hist.contents))
+    return _HIST_STRUCT.unpack_from(buf)
+
+
+def get_facs(dump_file):
+    """Return (symbols, length) for the dump file's facs, cached.
+
+    gw_facs_get_array exposes the whole GwSymbol* table in one call, so
+    enumerating wide designs costs two FFI calls total instead of one
+    gw_facs_get round trip per signal.
+    """
+    cached = _FACS_CACHE.get(dump_file)
+    if cached is not None:
+        return cached
+
+    facs = _gw_dump_file_get_facs(dump_file)
+    num_facs = _gw_facs_get_length(facs)
+    symbols = _gw_facs_get_array(facs)
+
+    cached = (symbols, num_facs)
+    _FACS_CACHE[dump_file] = cached
+    return cached
+
+
+def lookup_symbol(dump_file, name):
+    """Look up a signal by hierarchical name, cached per (dump file, name).
+
+    The cache is kept in move-to-front order: a hit costs one dict probe
+    plus a reorder, and repeated queries for a hot working set of
+    signals never reach gw_dump_file_lookup_symbol.  Returns the
+    GwSymbol, or None.
+    """
+    key = (dump_file, name)
+
+    if key in _SYMBOL_CACHE:
+        _SYMBOL_CACHE.move_to_end(key, last=False)
+        return _SYMBOL_CACHE[key]
+
+    symbol = _gw_dump_file_lookup_symbol(dump_file, name.encode())
+    symbol = symbol.contents if symbol else None
+
+    _SYMBOL_CACHE[key] = symbol
+    _SYMBOL_CACHE.move_to_end(key, last=False)
+    if len(_SYMBOL_CACHE) > _SYMBOL_CACHE_MAX:
+        _SYMBOL_CACHE.popitem(last=True)
+
+    return symbol
+
+
+@lru_cache(maxsize=4096)
+def lookup_node(dump_file, name):
+    """Return the unwrapped GwNode for a signal, or None if not found."""
+    symbol = lookup_symbol(dump_file, name)
+    return symbol.n.contents if symbol else None
+
+
+def _history_index(node):
+    """Return (times, entries, vals), the node's history sorted by time.
+
+    With NumPy and a current libgtkwave, one gw_node_flatten call turns
+    the linked list into struct-of-arrays form: times as int64, the raw
+    h_val codes as uint8 and the entry pointers alongside.  Otherwise
+    times/entries come from node->harray when libgtkwave has already
+    built it (see src/bsearch.c) or from a single list walk, and vals is
+    None.  The result is cached per node so repeated queries pay only
+    the search.
+    """
+    key = ctypes.addressof(node)
+    cached = _HISTORY_INDEX.get(key)
+    if cached is not None:
+        return cached
+
+    times = []
+    entries = []
+    vals = None
+
+    if np is not None and _gw_node_flatten is not None:
+        # numhist cannot size the arrays: after VCD import it holds the
+        # loader's last vlist position, not the list length.  A counting
+        # call (capacity 0, NULL outputs) reports the real length.
+        n = _gw_node_flatten(byref(node), 0, None, None, None)
+        times = np.empty(n, np.int64)
+        vals = np.empty(n, np.uint8)
+        entries = (POINTER(GwHistEnt) * n)()
+        _gw_node_flatten(
+            byref(node), n,
+            times.ctypes.data_as(POINTER(GwTime)),
+            vals.ctypes.data_as(POINTER(c_uint8)),
+            entries)
+    elif _gtkwave_numba.flatten is not None:
+        # Same SoA build, but the compiled walker chases the pointers
+        # when the library predates gw_node_flatten.  numhist is only a
+        # hint (see above), so grow until the walk fits with room to
+        # spare.
+        n = max(node.numhist, 16)
+        while True:
+            times = np.empty(n, np.int64)
+            vals = np.empty(n, np.uint8)
+            addrs = np.empty(n, np.uint64)
+            count = _gtkwave_numba.flatten(ctypes.addressof(node.head), times, vals, addrs)
+            if count < n:
+                break
+            n *= 2
+        times = times[:count]
+        vals = vals[:count]
+        entries = [ctypes.cast(int(addr), POINTER(GwHistEnt)) for addr in addrs[:count]]
+    elif node.harray and node.numhist > 0:
+        # One cast exposes the whole pointer table; indexing it avoids a
+        # ctypes POINTER.__getitem__ round trip per entry
+        addrs = (c_void_p * node.numhist).from_address(
+            ctypes.cast(node.harray, c_void_p).value)
+        for addr in addrs:
+            times.append(_HIST_STRUCT.unpack_from(
+                (c_uint8 * _HIST_STRUCT.size).from_address(addr))[2])
+            entries.append(ctypes.cast(addr, POINTER(GwHistEnt)))
+    else:
+        addr = ctypes.addressof(node.head)
+        while addr:
+            next_addr, _, entry_time, _ = _HIST_STRUCT.unpack_from(
+                (c_uint8 * _HIST_STRUCT.size).from_address(addr))
+            times.append(entry_time)
+            entries.append(ctypes.cast(addr, POINTER(GwHistEnt)))
+            addr = next_addr
+
+    cached = (times, entries, vals)
+    _HISTORY_INDEX[key] = cached
+    return cached
+
+
+def prefetch_history(nodes, max_workers=None):
+    """Build the history indexes for several nodes concurrently.
+
+    ctypes drops the GIL for the duration of a foreign call, so the
+    gw_node_flatten walks run truly in parallel; libgtkwave only reads
+    the (disjoint) nodes.  For large traces the flatten dominates the
+    query phase, so this scales roughly with core count.  Nodes already
+    indexed are skipped by the per-node cache.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(_history_index, nodes):
+            pass
+
+
+def find_value_at_time(node, time):
+    """Find the history entry at or before the given time.
+
+    Returns a POINTER(GwHistEnt), or None if there is no entry yet.
+    O(log numhist) per query instead of a full list walk.
+    """
+    times, entries, _ = _history_index(node)
+
+    if np is not None and isinstance(times, np.ndarray):
+        i = int(np.searchsorted(times, time, side="right"))
+    else:
+        i = bisect.bisect_right(times, time)
+
+    if i == 0:
+        return None
+    return entries[i - 1]
+
+
+def find_values_at_times(node, times):
+    """Find the history entries for several query times in one pass.
+
+    times must be sorted ascending.  The sorted queries are merge-joined
+    against the node's sorted history, so the whole batch costs
+    O(numhist + len(times)) instead of one bisect (or list walk) per
+    query.  Returns a list parallel to times of POINTER(GwHistEnt) or
+    None entries.
+    """
+    hist_times, entries, _ = _history_index(node)
+    n = len(hist_times)
+
+    results = []
+    i = 0
+    for t in times:
+        while i < n and hist_times[i] <= t:
+            i += 1
+        results.append(entries[i - 1] if i > 0 else None)
+
+    return results
+
+
+def scalar_values_at_times(node, times):
+    """Batch variant for scalar signals returning the raw GwBit codes.
+
+    Returns a numpy uint8 array when NumPy is available, otherwise a
+    bytearray.  Times without a value yet are reported as GW_BIT_X.
+    """
+    hist_times, _, vals = _history_index(node)
+
+    if vals is not None:
+        # Fully vectorized: searchsorted into the SoA arrays, no
+        # per-entry pointer dereference at all
+        idx = np.searchsorted(hist_times, np.asarray(times, np.int64),
+                              side="right") - 1
+        out = np.where(idx >= 0, vals[np.maximum(idx, 0)], np.uint8(GW_BIT_X))
+        return out.astype(np.uint8)
+
+    hists = find_values_at_times(node, times)
+    out = np.empty(len(hists), np.uint8) if np is not None else bytearray(len(hists))
+
+    for i, hist in enumerate(hists):
+        out[i] = (_hist_fields(hist)[1] & 0xFF) if hist is not None else GW_BIT_X
+
+    return out
+
+
+def find_value_at_time_uncached(node, time):
+    """Single-query variant that skips the index; one FFI call per query."""
+    if _gw_node_find_hist_at_time is not None:
+        hist = _gw_node_find_hist_at_time(byref(node), time)
+        return hist if hist else None
+
+    if _gtkwave_numba.walk_to_time is not None:
+        addr = _gtkwave_numba.walk_to_time(ctypes.addressof(node.head), time)
+        return ctypes.cast(addr, POINTER(GwHistEnt)) if addr else None
+
+    if _cffi is not None:
+        addr = _cffi.find_value_at_time(ctypes.addressof(node.head), time)
+        return ctypes.cast(addr, POINTER(GwHistEnt)) if addr else None
+
+    # Walk the linked list to find the last entry where entry->time <= time,
+    # unpacking each entry's raw bytes instead of going through the
+    # ctypes field descriptors
+    addr = ctypes.addressof(node.head)
+    result = 0
+
+    while addr:
+        next_addr, _, entry_time, _ = _HIST_STRUCT.unpack_from(
+            (c_uint8 * _HIST_STRUCT.size).from_address(addr))
+        if entry_time > time:
+            break
+        result = addr
+        addr = next_addr
+
+    return ctypes.cast(result, POINTER(GwHistEnt)) if result else None
+
+
+def print_scalar_value(hist):
+    """Return the display character for a scalar (1-bit) history entry."""
+    if not hist:
+        return "X"
+
+    _, v_raw, _, _ = _hist_fields(hist)
+    return _BIT_TO_CHAR[v_raw & 0xF]
+
+
+@lru_cache(maxsize=64)
+def _weights(width):
+    """Descending bit weights (MSB first) for a width-bit vector.
+
+    A trace uses a handful of distinct widths, so the shift-per-bit cost
+    of building the weight vector is paid once per width rather than on
+    every decode.
+    """
+    return np.left_shift(1, np.arange(width - 1, -1, -1, dtype=np.uint64),
+                         dtype=np.uint64)
+
+
+@lru_cache(maxsize=64)
+def _make_decoder(width):
+    """Generate an unrolled decoder for width GwBit bytes.
+
+    A trace uses a small fixed set of widths, so the first decode of a
+    new width pays for eval()-ing a lambda that ORs the shifted per-byte
+    tests with no loop; every later decode of that width runs straight
+    through the generated bytecode.  Unknown states decode as 0, like
+    the NumPy dot-product path.
+    """
+    body = " | ".join("((raw[%d] == %d) << %d)" % (i, GW_BIT_1, width - 1 - i)
+                      for i in range(width))
+    return eval("lambda raw: %s" % body)
+
+
+@lru_cache(maxsize=65536)
+def _decode_vector(h_vector, width):
+    """Decode width GwBit bytes at address h_vector into a decimal string.
+
+    Memoized: a register commonly holds one value for thousands of
+    cycles, so a dense time sweep resolves the same history entry (and
+    the same buffer address) again and again.  Safe because history
+    entries are immutable once the dump file has been imported.
+    """
+    # Convert binary to decimal for easier reading
+    if np is not None and width <= 64:
+        # One vectorized pass over the raw GwBit buffer instead of a
+        # ctypes indexing round trip per bit
+        buf = np.ctypeslib.as_array(
+            (c_uint8 * width).from_address(h_vector))
+        return str(int((buf == GW_BIT_1).dot(_weights(width))))
+
+    raw = ctypes.string_at(h_vector, width)
+
+    # Specialized unrolled decoder per width; same semantics as the
+    # NumPy branch
+    if width <= 64:
+        return str(_make_decoder(width)(raw))
+
+    # Zero-copy wide-vector fallback: one C-level translate to ASCII
+    # bit characters, one C-level int parse
+    ascii_bits = raw.translate(_GWBIT_TO_ASCII)
+
+    try:
+        return str(int(ascii_bits, 2))
+    except ValueError:
+        # x/z/other states present; show the bit string instead
+        return ascii_bits.decode("ascii")
+
+
+def print_vector_value(node, hist):
+    """Return the decimal value of a vector (multi-bit) history entry."""
+    if not hist:
+        return "X"
+
+    _, h_vector, hist_time, _ = _hist_fields(hist)
+    if hist_time < 0:
+        return "X"
+
+    return _decode_vector(h_vector, abs(node.msi - node.lsi) + 1)
+
+
+def main():
+    filename = "./tests/basic.vcd"
+
+    if len(sys.argv) > 1:
+        filename = sys.argv[1]
+
+    print("Reading waveform file: %s" % filename)
+    print("=====================================\n")
+
+    # Determine file type based on extension and create appropriate loader
+    if filename.endswith(".fst"):
+        loader = _gw_fst_loader_new()
+        file_type = "FST"
+    elif filename.endswith(".vcd") or filename.endswith(".vcd.gz"):
+        loader = _gw_vcd_loader_new()
+        file_type = "VCD"
+    elif filename.endswith(".ghw"):
+        loader = _gw_ghw_loader_new()
+        file_type = "GHW"
+    else:
+        sys.stderr.write("Error: Unsupported file format\n")
+        sys.stderr.write("Supported formats: .fst, .vcd, .vcd.gz, .ghw\n")
+        return 1
+
+    if not loader:
+        sys.stderr.write("Error: Failed to create %s loader\n" % file_type)
+        return 1
+
+    print("Detected format: %s" % file_type)
+
+    # Load the waveform file
+    error = POINTER(GError)()
+    dump_file = _gw_loader_load(loader, filename.encode(), byref(error))
+    _g_object_unref(loader)
+
+    if not dump_file:
+        _report_error("Failed to load %s file" % file_type, error)
+        return 1
+
+    print("✓ %s file loaded successfully" % file_type)
+
+    # Import all traces (need to import twice for aliases as mentioned in dump.c)
+    for attempt in ("", " (2nd pass)"):
+        error = POINTER(GError)()
+        if not _gw_dump_file_import_all(dump_file, byref(error)):
+            _report_error("Failed to import traces%s" % attempt, error)
+            _g_object_unref(dump_file)
+            return 1
+
+    print("✓ Traces imported successfully\n")
+
+    # Get time range
+    time_range = _gw_dump_file_get_time_range(dump_file)
+    start_time = _gw_time_range_get_start(time_range)
+    end_time = _gw_time_range_get_end(time_range)
+
+    print("Time range: %d to %d" % (start_time, end_time))
+    print("Time scale: %d" % _gw_dump_file_get_time_scale(dump_file))
+    print()
+
+    # List all available signals
+    print("Available signals:")
+    symbols, num_facs = get_facs(dump_file)
+    print("Total: %u signals" % num_facs)
+    for i in range(min(num_facs, 20)):
+        print("  [%u] %s" % (i, symbols[i].contents.name.decode()))
+    print()
+
+    # Look up signals (cached, so repeated queries are free)
+    clk_symbol = lookup_symbol(dump_file, "tb.clk")
+    cycle_symbol = lookup_symbol(dump_file, "tb.cycle[7:0]")
+
+    if not clk_symbol:
+        sys.stderr.write("Error: Could not find signal 'tb.clk'\n")
+        _g_object_unref(dump_file)
+        return 1
+
+    if not cycle_symbol:
+        sys.stderr.write("Error: Could not find signal 'tb.cycle'\n")
+        _g_object_unref(dump_file)
+        return 1
+
+    print("✓ Found signal: %s" % clk_symbol.name.decode())
+    print("✓ Found signal: %s" % cycle_symbol.name.decode())
+    print()
+
+    # Get the nodes
+    clk_node = lookup_node(dump_file, "tb.clk")
+    cycle_node = lookup_node(dump_file, "tb.cycle[7:0]")
+
+    print("Signal Info:")
+    print("  clk:   %d transitions" % clk_node.numhist)
+    print("  cycle: %d transitions, width=%d bits [%d:%d]" %
+          (cycle_node.numhist,
+           abs(cycle_node.msi - cycle_node.lsi) + 1,
+           cycle_node.msi, cycle_node.lsi))
+    print()
+
+    # Read and print signal values at different time points
+    print("Signal Values:")
+    print("Time | clk | cycle")
+    print("-----|-----|------")
+
+    # Index both signals' histories concurrently, then one merge-join
+    # pass per signal instead of one lookup per time point
+    prefetch_history([clk_node, cycle_node])
+
+    query_times = list(range(0, 31, 5))
+    clk_hists = find_values_at_times(clk_node, query_times)
+    cycle_hists = find_values_at_times(cycle_node, query_times)
+
+    for t, clk_hist, cycle_hist in zip(query_times, clk_hists, cycle_hists):
+        print("%4d |  %s  |  %s" %
+              (t,
+               print_scalar_value(clk_hist),
+               print_vector_value(cycle_node, cycle_hist)))
+
+    print()
+
+    # Demonstrate reading specific values (like the Python API you want)
+    print("Example: Reading specific values")
+    print("=====================================")
+
+    for query_time in (7, 20):
+        clk_hist = find_value_at_time(clk_node, query_time)
+        cycle_hist = find_value_at_time(cycle_node, query_time)
+
+        print("At time %d:" % query_time)
+        print("  tb.clk = %s" % print_scalar_value(clk_hist))
+        print("  tb.cycle = %s" % print_vector_value(cycle_node, cycle_hist))
+        print()
+
+    # Clean up; drop caches holding pointers into the freed dump file
+    _SYMBOL_CACHE.clear()
+    lookup_node.cache_clear()
+    _decode_vector.cache_clear()
+    _HISTORY_INDEX.clear()
+    _FACS_CACHE.clear()
+    _g_object_unref(dump_file)
+
+    print("✓ Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())